@@ -9,16 +9,157 @@ download the simulation results as CSV and a personalised PDF report.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import io
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
 import streamlit as st
 import pandas as pd
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 
-from data_loader import list_countries, get_country_data
+from data_loader import list_countries, get_country_data, country_index, CountryRiskData
 from utils import load_price_file, align_price_series
-from monte_carlo import compute_returns, simulate_portfolios
-from pdf_report import generate_pdf_report
+from monte_carlo import (
+    compute_returns, annualised_moments, simulate_portfolios, efficient_frontier,
+)
+from selection import horizon_years, scale_to_horizon, select_portfolio
+
+# Goals whose recommended portfolio lies on the mean-variance frontier and can
+# therefore be solved in closed form instead of by random sampling.
+CLOSED_FORM_GOALS = {'Capital Preservation', 'Long-Term Growth', 'High Risk-High Return'}
+
+# Initial capacity (bytes) of the in-memory PDF report buffer.
+PDF_SIZE_HINT = 512 * 1024
+
+
+@st.cache_resource(show_spinner=False)
+def _countries() -> Tuple[str, ...]:
+    return list_countries()
+
+
+@st.cache_resource(show_spinner=False)
+def _country_data(country: str) -> CountryRiskData:
+    return get_country_data(country)
+
+
+def _upload_digest(file: UploadedFile) -> Tuple[str, int, bytes]:
+    """Content fingerprint of an upload, so reruns hit the parse cache."""
+    return file.name, file.size, hashlib.blake2b(file.getbuffer(), digest_size=16).digest()
+
+
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: _upload_digest})
+def _load_price_file(file: UploadedFile) -> pd.Series:
+    """Parse an uploaded CSV, memoised on the file's content digest."""
+    file.seek(0)
+    return load_price_file(file, file.name)
+
+
+@st.cache_data(show_spinner=False)
+def _align_price_series(series: Tuple[pd.Series, ...]) -> pd.DataFrame:
+    """Align parsed price series, memoised on their contents."""
+    return align_price_series(list(series))
+
+
+@functools.lru_cache(maxsize=None)
+def _mpl():
+    """Import matplotlib on first use so sessions that never simulate skip it."""
+    import matplotlib
+    import matplotlib.cm
+    import matplotlib.colors
+    return matplotlib
+
+
+def _frontier_figure():
+    """
+    Return the (figure, axes, colourbar axes) used for the frontier chart.
+
+    The figure is built once per session, outside pyplot's global figure
+    registry, and cleared and redrawn on later reruns.
+    """
+    if 'frontier_fig' not in st.session_state:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(8, 6), layout='constrained')
+        grid = fig.add_gridspec(1, 2, width_ratios=[20, 1])
+        st.session_state['frontier_fig'] = (
+            fig, fig.add_subplot(grid[0]), fig.add_subplot(grid[1])
+        )
+    return st.session_state['frontier_fig']
+
+
+@st.cache_data(show_spinner=False)
+def _returns_and_moments(
+    prices_df: pd.DataFrame,
+    shrink: bool,
+) -> Tuple[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+    """Returns plus annualised mean/covariance, reused across runs on the same prices."""
+    returns = compute_returns(prices_df)
+    return returns, annualised_moments(returns, shrink=shrink)
+
+
+def _run_simulation(
+    prices_df: pd.DataFrame,
+    rf_rate: float,
+    n_portfolios: int,
+    seed: int,
+    closed_form: bool,
+    shrink: bool,
+) -> pd.DataFrame:
+    """Compute returns and simulate (or solve) the portfolio frontier."""
+    returns, moments = _returns_and_moments(prices_df, shrink)
+    if closed_form:
+        sim_df, _ = efficient_frontier(
+            returns, rf_rate=rf_rate, n_points=n_portfolios, moments=moments
+        )
+    else:
+        sim_df, _ = simulate_portfolios(
+            returns,
+            rf_rate=rf_rate,
+            n_portfolios=n_portfolios,
+            random_state=np.random.Generator(np.random.PCG64DXSM(seed or None)),
+            moments=moments,
+            dtype=np.float32,
+        )
+    # Single precision is ample for selection, plotting and export and halves
+    # the bytes scanned by every pass over the frame
+    return sim_df.astype(np.float32)
+
+
+_run_simulation_cached = st.cache_data(show_spinner=False)(_run_simulation)
+
+
+def _scatter_sample(vol: np.ndarray, ret: np.ndarray, max_points: int = 500) -> np.ndarray:
+    """
+    Pick the indices of at most roughly ``max_points`` portfolios to plot.
+
+    Every portfolio on the upper or lower boundary of the cloud (a new
+    running maximum or minimum return when sorted by volatility) is kept
+    so the frontier shape is preserved; the remainder is a fixed random
+    sample of interior points.
+    """
+    n = vol.size
+    if n <= max_points:
+        return np.arange(n)
+    order = np.argsort(vol, kind='stable')
+    sorted_ret = ret[order]
+    boundary = (
+        (sorted_ret >= np.maximum.accumulate(sorted_ret))
+        | (sorted_ret <= np.minimum.accumulate(sorted_ret))
+    )
+    edge = order[boundary]
+    interior = order[~boundary]
+    n_fill = min(interior.size, max(max_points - edge.size, 0))
+    fill = np.random.default_rng(0).choice(interior, size=n_fill, replace=False)
+    return np.concatenate([edge, fill])
+
+
+@st.cache_data(show_spinner=False)
+def _simulation_csv(sim_df: pd.DataFrame) -> bytes:
+    """Encode simulation results as CSV bytes, memoised on the frame contents."""
+    buf = io.BytesIO()
+    sim_df.to_csv(buf, index=False, float_format='%.6g', encoding='utf-8')
+    return buf.getvalue()
 
 
 def main() -> None:
@@ -28,8 +169,8 @@ def main() -> None:
     # Sidebar: investor profile
     st.sidebar.header('Investor Profile')
     name = st.sidebar.text_input('Name (optional)')
-    countries = list_countries()
-    default_country_index = countries.index('India') if 'India' in countries else 0
+    countries = _countries()
+    default_country_index = country_index('India')
     country = st.sidebar.selectbox('Country', countries, index=default_country_index)
     risk_tolerance = st.sidebar.selectbox('Risk Tolerance', ['Low', 'Moderate', 'High'])
     investment_goal = st.sidebar.selectbox('Investment Goal', [
@@ -38,7 +179,7 @@ def main() -> None:
     investment_horizon = st.sidebar.selectbox('Investment Horizon', ['1Y', '3Y', '5Y', '10+Y'])
 
     # Market assumptions
-    country_data = get_country_data(country)
+    country_data = _country_data(country)
     st.sidebar.subheader('Market Assumptions')
     st.sidebar.write(f'Mature ERP (derived): {country_data.mature_erp:.2f}%')
     st.sidebar.write(f'Country Risk Premium (CRP): {country_data.crp:.2f}%')
@@ -64,6 +205,19 @@ def main() -> None:
         help='Set a random number to get the same simulation results every time. '
              'Leave as 0 for random results on each run.'
     )
+    use_closed_form = st.sidebar.checkbox(
+        'Use closed-form efficient frontier',
+        value=False,
+        help='Solve the frontier analytically instead of sampling random portfolios '
+             'for the Capital Preservation, Long-Term Growth and High Risk-High Return '
+             'goals. Weights are unconstrained and may include short positions.'
+    )
+    shrink_cov = st.sidebar.checkbox(
+        'Shrink covariance (Ledoit-Wolf)',
+        value=False,
+        help='Use a Ledoit-Wolf shrinkage estimate of the covariance matrix, which '
+             'is better conditioned when there are few observations per asset.'
+    )
 
     st.subheader('Upload Historical Price Data')
     st.write(
@@ -80,7 +234,7 @@ def main() -> None:
 
         for file in uploaded_files:
             try:
-                series = load_price_file(file, file.name)
+                series = _load_price_file(file)
                 tickers.append(series.name)
                 price_series.append(series)
             except Exception as e:
@@ -95,69 +249,49 @@ def main() -> None:
             if not (3 <= len(price_series) <= 10):
                 st.warning('Please upload between 3 and 10 tickers.')
             else:
-                prices_df = align_price_series(price_series)
+                prices_df = _align_price_series(tuple(price_series))
                 if prices_df.empty:
                     st.error('No overlapping dates found across the uploaded files.')
                 else:
                     st.success('Price data loaded successfully!')
                     st.write(f'Aligned data contains {prices_df.shape[0]} observations.')
 
+                    closed_form = use_closed_form and investment_goal in CLOSED_FORM_GOALS
+                    sim_key = (
+                        int(pd.util.hash_pandas_object(prices_df).sum()),
+                        tuple(prices_df.columns),
+                        rf_input, int(n_portfolios), int(seed), closed_form, shrink_cov,
+                    )
                     if st.button('Run Monte Carlo Simulation'):
-                        with st.spinner('Running simulation...'):
-                            returns = compute_returns(prices_df)
-                            sim_df, optimal_dict = simulate_portfolios(
-                                returns,
-                                rf_rate=rf_input / 100.0,
-                                n_portfolios=int(n_portfolios),
-                                random_state=int(seed) if seed else None,
+                        # A zero seed asks for fresh draws on every run, so skip the cache
+                        run = _run_simulation_cached if seed else _run_simulation
+                        try:
+                            with st.spinner('Running simulation...'):
+                                st.session_state['sim_df'] = run(
+                                    prices_df, rf_input / 100.0, int(n_portfolios),
+                                    int(seed), closed_form, shrink_cov,
+                                )
+                            st.session_state['sim_key'] = sim_key
+                        except np.linalg.LinAlgError:
+                            # Duplicate assets or fewer observations than assets
+                            st.error(
+                                'The closed-form frontier needs an invertible covariance matrix, '
+                                'but the uploaded assets are perfectly correlated or have too few '
+                                'observations. Enable "Shrink covariance (Ledoit-Wolf)" or untick '
+                                'the closed-form option.'
                             )
 
-                        # === Horizon Scaling ===
-                        try:
-                            h = int(investment_horizon.rstrip('Y').rstrip('+'))
-                        except ValueError:
-                            h = 1
-                        sim_df['Return_h'] = (1 + sim_df['Return']) ** h - 1
-                        sim_df['Volatility_h'] = sim_df['Volatility'] * (h ** 0.5)
+                    # Results persist across reruns so profile changes only redo selection
+                    if st.session_state.get('sim_key') == sim_key:
                         rf_rate = rf_input / 100.0
-                        sim_df['Sharpe_h'] = (
-                            sim_df['Return_h'] - rf_rate * h
-                        ) / sim_df['Volatility_h']
-
-                        # === Apply Risk Tolerance Filter ===
-                        if risk_tolerance == 'Low':
-                            vol_thresh = sim_df['Volatility_h'].quantile(0.25)
-                            candidate_df = sim_df[sim_df['Volatility_h'] <= vol_thresh]
-                            rt_label = 'Low Risk'
-                        elif risk_tolerance == 'High':
-                            candidate_df = sim_df
-                            rt_label = 'High Risk'
-                        else:  # Moderate
-                            candidate_df = sim_df
-                            rt_label = 'Moderate Risk'
-
-                        # === Select by Investment Goal within candidate_df ===
-                        if investment_goal == 'Capital Preservation':
-                            idx = candidate_df['Volatility_h'].idxmin()
-                            goal_label = 'Min Volatility'
-                        elif investment_goal == 'High Risk-High Return':
-                            idx = candidate_df['Return_h'].idxmax()
-                            goal_label = 'High Return'
-                        elif investment_goal == 'Long-Term Growth':
-                            idx = candidate_df['Sharpe_h'].idxmax()
-                            goal_label = 'Max Sharpe'
-                        else:  # Balanced
-                            med_vol = candidate_df['Volatility_h'].median()
-                            idx = (candidate_df['Volatility_h'] - med_vol).abs().idxmin()
-                            goal_label = 'Balanced'
-
-                        row = sim_df.loc[idx]
-                        chosen = {
-                            'weights': {t: row[t] for t in tickers},
-                            'return': row['Return_h'],
-                            'volatility': row['Volatility_h'],
-                            'sharpe': row['Sharpe_h'],
-                        }
+                        sim_df = scale_to_horizon(
+                            st.session_state['sim_df'], horizon_years(investment_horizon), rf_rate
+                        )
+                        chosen = select_portfolio(sim_df, tickers, risk_tolerance, investment_goal)
+                        rt_label, goal_label = chosen['risk_label'], chosen['goal_label']
+                        ret_h = sim_df['Return_h'].to_numpy()
+                        vol_h = sim_df['Volatility_h'].to_numpy()
+                        sharpe_h = sim_df['Sharpe_h'].to_numpy()
 
                         # === Display Recommended Portfolio ===
                         st.subheader(f'Recommended Portfolio ({rt_label} + {goal_label})')
@@ -170,12 +304,15 @@ def main() -> None:
 
                         # === Efficient Frontier (Horizon-Scaled) ===
                         st.subheader('Efficient Frontier')
-                        import matplotlib.pyplot as plt
-                        fig, ax = plt.subplots(figsize=(8, 6))
-                        sc = ax.scatter(
-                            sim_df['Volatility_h'], sim_df['Return_h'],
-                            c=sim_df['Sharpe_h'], cmap='viridis', s=10
-                        )
+                        fig, ax, cax = _frontier_figure()
+                        ax.cla()
+                        cax.cla()
+                        plot_idx = _scatter_sample(vol_h, ret_h)
+                        norm = _mpl().colors.Normalize(np.nanmin(sharpe_h), np.nanmax(sharpe_h))
+                        cmap = _mpl().colormaps['viridis']
+                        # Map Sharpe ratios to RGBA once so scatter skips its own normalisation
+                        point_colors = cmap(norm(sharpe_h[plot_idx])).astype(np.float32)
+                        ax.scatter(vol_h[plot_idx], ret_h[plot_idx], c=point_colors, s=10)
                         ax.scatter(
                             chosen['volatility'], chosen['return'],
                             marker='*', color='red', s=150,
@@ -185,20 +322,23 @@ def main() -> None:
                         ax.set_ylabel('Return (horizon scaled)')
                         ax.set_title('Efficient Frontier')
                         ax.legend()
-                        cbar = fig.colorbar(sc, ax=ax)
-                        cbar.set_label('Sharpe Ratio (horizon scaled)')
-                        st.pyplot(fig)
+                        fig.colorbar(
+                            _mpl().cm.ScalarMappable(norm=norm, cmap=cmap), cax=cax,
+                            label='Sharpe Ratio (horizon scaled)',
+                        )
+                        st.pyplot(fig, clear_figure=False)
 
                         # === Allocation Table ===
                         st.subheader('Portfolio Allocation')
-                        alloc_df = pd.DataFrame.from_dict(
-                            chosen['weights'], orient='index', columns=['Weight']
+                        weight_pct = np.fromiter(chosen['weights'].values(), dtype=float) * 100
+                        alloc_df = pd.DataFrame(
+                            [np.char.add(np.char.mod('%.2f', weight_pct), '%')],
+                            columns=list(chosen['weights']), index=['Weight'],
                         )
-                        alloc_df['Weight'] = alloc_df['Weight'].map(lambda x: f'{x:.2%}')
-                        st.table(alloc_df.T)
+                        st.table(alloc_df)
 
                         # === Download Simulation CSV ===
-                        csv_data = sim_df.to_csv(index=False).encode('utf-8')
+                        csv_data = _simulation_csv(sim_df)
                         st.download_button(
                             '📄 Download Simulation CSV',
                             data=csv_data,
@@ -207,7 +347,9 @@ def main() -> None:
                         )
 
                         # === Generate PDF Report ===
-                        buffer = io.BytesIO()
+                        from pdf_report import generate_pdf_report
+                        # Pre-size so the PDF writer fills one allocation instead of regrowing
+                        buffer = io.BytesIO(bytes(PDF_SIZE_HINT))
                         user_profile = {
                             'name': name,
                             'country': country,
@@ -16,31 +16,31 @@ yields for each country and may be overridden by the user in the UI.
 
 Usage:
 
->>> from data_loader import get_country_data, list_countries
+>>> from data_loader import get_country_data, list_countries, country_index
 >>> params = get_country_data('India')
 >>> params['crp']  # 2.93
 >>> list_countries()
+>>> country_index('India')  # position of India in list_countries()
 
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, NamedTuple, Tuple
 
 
-@dataclass
-class CountryRiskData:
-    """Container for market assumptions for a single country."""
+class CountryRiskData(NamedTuple):
+    """Immutable container for market assumptions for a single country."""
     country: str
-    erp: float  # equity risk premium (mature + country)
-    crp: float  # country risk premium (CRP)
-    rf: float   # default risk‑free rate (can be overridden)
+    erp: float         # equity risk premium (mature + country)
+    crp: float         # country risk premium (CRP)
+    rf: float          # default risk‑free rate (can be overridden)
+    mature_erp: float  # mature market ERP (ERP minus CRP)
 
-    @property
-    def mature_erp(self) -> float:
-        """Return the mature market ERP (equity risk premium minus CRP)."""
-        return self.erp - self.crp
+
+def _entry(country: str, erp: float, crp: float, rf: float) -> CountryRiskData:
+    """Build a table entry, deriving the mature ERP once at import."""
+    return CountryRiskData(country, erp, crp, rf, erp - crp)
 
 
 # ---------------------------------------------------------------------------
@@ -51,43 +51,59 @@ class CountryRiskData:
 # by subtracting CRP from ERP【90480415847186†L21-L34】.
 _COUNTRY_DATA: Dict[str, CountryRiskData] = {
     # North America / Mature markets
-    'United States': CountryRiskData('United States', erp=4.33, crp=0.00, rf=4.21),  # 【325874986942418†L6480-L6484】
-    'Canada':        CountryRiskData('Canada',        erp=4.33, crp=0.00, rf=3.10),
-    'Mexico':        CountryRiskData('Mexico',        erp=7.67, crp=3.34, rf=9.00),
+    'United States': _entry('United States', erp=4.33, crp=0.00, rf=4.21),  # 【325874986942418†L6480-L6484】
+    'Canada':        _entry('Canada',        erp=4.33, crp=0.00, rf=3.10),
+    'Mexico':        _entry('Mexico',        erp=7.67, crp=3.34, rf=9.00),
     # Europe
-    'United Kingdom': CountryRiskData('United Kingdom', erp=5.13, crp=0.80, rf=4.50),  # 【325874986942418†L6472-L6476】
-    'Germany':       CountryRiskData('Germany',       erp=4.33, crp=0.00, rf=2.50),  # 【325874986942418†L5501-L5504】
-    'France':        CountryRiskData('France',        erp=4.86, crp=0.53, rf=2.60),
-    'Italy':         CountryRiskData('Italy',         erp=7.26, crp=2.93, rf=4.00),  # same CRP as India
-    'Spain':         CountryRiskData('Spain',         erp=5.46, crp=1.13, rf=3.20),
-    'Netherlands':   CountryRiskData('Netherlands',   erp=4.86, crp=0.53, rf=2.50),
-    'Switzerland':   CountryRiskData('Switzerland',   erp=5.13, crp=0.80, rf=1.00),
-    'Russia':        CountryRiskData('Russia',        erp=16.35, crp=12.02, rf=9.00),
+    'United Kingdom': _entry('United Kingdom', erp=5.13, crp=0.80, rf=4.50),  # 【325874986942418†L6472-L6476】
+    'Germany':       _entry('Germany',       erp=4.33, crp=0.00, rf=2.50),  # 【325874986942418†L5501-L5504】
+    'France':        _entry('France',        erp=4.86, crp=0.53, rf=2.60),
+    'Italy':         _entry('Italy',         erp=7.26, crp=2.93, rf=4.00),  # same CRP as India
+    'Spain':         _entry('Spain',         erp=5.46, crp=1.13, rf=3.20),
+    'Netherlands':   _entry('Netherlands',   erp=4.86, crp=0.53, rf=2.50),
+    'Switzerland':   _entry('Switzerland',   erp=5.13, crp=0.80, rf=1.00),
+    'Russia':        _entry('Russia',        erp=16.35, crp=12.02, rf=9.00),
     # Asia
-    'India':         CountryRiskData('India',         erp=7.26, crp=2.93, rf=6.92),  # 【325874986942418†L5622-L5625】
-    'China':         CountryRiskData('China',         erp=5.27, crp=0.94, rf=2.70),  # 【325874986942418†L5622-L5625】
-    'Japan':         CountryRiskData('Japan',         erp=5.27, crp=0.94, rf=0.35),  # 【325874986942418†L5702-L5705】
-    'Australia':     CountryRiskData('Australia',     erp=4.33, crp=0.00, rf=3.80),
-    'Singapore':     CountryRiskData('Singapore',     erp=4.99, crp=0.66, rf=3.10),
-    'South Korea':   CountryRiskData('South Korea',   erp=6.87, crp=2.54, rf=3.30),
-    'Indonesia':     CountryRiskData('Indonesia',     erp=6.87, crp=2.54, rf=7.00),
+    'India':         _entry('India',         erp=7.26, crp=2.93, rf=6.92),  # 【325874986942418†L5622-L5625】
+    'China':         _entry('China',         erp=5.27, crp=0.94, rf=2.70),  # 【325874986942418†L5622-L5625】
+    'Japan':         _entry('Japan',         erp=5.27, crp=0.94, rf=0.35),  # 【325874986942418†L5702-L5705】
+    'Australia':     _entry('Australia',     erp=4.33, crp=0.00, rf=3.80),
+    'Singapore':     _entry('Singapore',     erp=4.99, crp=0.66, rf=3.10),
+    'South Korea':   _entry('South Korea',   erp=6.87, crp=2.54, rf=3.30),
+    'Indonesia':     _entry('Indonesia',     erp=6.87, crp=2.54, rf=7.00),
     # South America
-    'Brazil':        CountryRiskData('Brazil',        erp=7.67, crp=3.34, rf=10.00),  # 【325874986942418†L5501-L5504】
-    'Argentina':     CountryRiskData('Argentina',     erp=20.35, crp=16.02, rf=35.00),
-    'Chile':         CountryRiskData('Chile',         erp=5.46, crp=1.13, rf=4.00),
+    'Brazil':        _entry('Brazil',        erp=7.67, crp=3.34, rf=10.00),  # 【325874986942418†L5501-L5504】
+    'Argentina':     _entry('Argentina',     erp=20.35, crp=16.02, rf=35.00),
+    'Chile':         _entry('Chile',         erp=5.46, crp=1.13, rf=4.00),
     # Africa
-    'South Africa':  CountryRiskData('South Africa',  erp=13.01, crp=8.68, rf=11.00),
-    'Egypt':         CountryRiskData('Egypt',         erp=14.34, crp=10.01, rf=15.00),
+    'South Africa':  _entry('South Africa',  erp=13.01, crp=8.68, rf=11.00),
+    'Egypt':         _entry('Egypt',         erp=14.34, crp=10.01, rf=15.00),
     # Middle East
-    'United Arab Emirates': CountryRiskData('United Arab Emirates', erp=4.99, crp=0.66, rf=3.40),
-    'Saudi Arabia':  CountryRiskData('Saudi Arabia',  erp=5.27, crp=0.94, rf=4.50),
-    'Turkey':        CountryRiskData('Turkey',        erp=16.35, crp=12.02, rf=25.00),
+    'United Arab Emirates': _entry('United Arab Emirates', erp=4.99, crp=0.66, rf=3.40),
+    'Saudi Arabia':  _entry('Saudi Arabia',  erp=5.27, crp=0.94, rf=4.50),
+    'Turkey':        _entry('Turkey',        erp=16.35, crp=12.02, rf=25.00),
 }
 
 
-def list_countries() -> List[str]:
-    """Return a sorted list of country names available in the data set."""
-    return sorted(_COUNTRY_DATA.keys())
+# Sorted names and their positions are fixed at import; Streamlit reruns the
+# sidebar on every interaction so avoid re-sorting each time.
+_COUNTRIES_SORTED: Tuple[str, ...] = tuple(sorted(_COUNTRY_DATA.keys()))
+_COUNTRY_INDEX: Dict[str, int] = {c: i for i, c in enumerate(_COUNTRIES_SORTED)}
+
+
+def list_countries() -> Tuple[str, ...]:
+    """Return a sorted tuple of country names available in the data set."""
+    return _COUNTRIES_SORTED
+
+
+def country_index(country: str) -> int:
+    """
+    Return the position of ``country`` in ``list_countries()``.
+
+    Unknown countries map to 0 so the result can be used directly as a
+    default widget index.
+    """
+    return _COUNTRY_INDEX.get(country, 0)
 
 
 def get_country_data(country: str) -> CountryRiskData:
@@ -103,7 +119,7 @@ def get_country_data(country: str) -> CountryRiskData:
     Returns
     -------
     CountryRiskData
-        A dataclass instance containing the ERP, CRP and default Rf.
+        A named tuple containing the ERP, CRP, default Rf and mature ERP.
 
     Raises
     ------
@@ -17,6 +17,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Tuple
 
+from monte_carlo_nb import NUMBA_AVAILABLE, portfolio_stats
+
 
 def compute_returns(prices: pd.DataFrame) -> pd.DataFrame:
     """
@@ -33,8 +35,27 @@ def compute_returns(prices: pd.DataFrame) -> pd.DataFrame:
     DataFrame
         DataFrame of percentage returns (rows = dates, columns = tickers).
     """
-    returns = prices.pct_change().dropna()
-    return returns
+    values = prices.to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = values[1:] / values[:-1] - 1.0
+    index = prices.index[1:]
+    # Drop periods touching a missing price, as pct_change().dropna() would
+    missing = np.isnan(returns).any(axis=1)
+    if missing.any():
+        returns = returns[~missing]
+        index = index[~missing]
+    return pd.DataFrame(returns, index=index, columns=prices.columns)
+
+
+# Portfolios evaluated per block by the NumPy simulation path
+SIM_BLOCK_SIZE = 4096
+
+# Periods per year keyed on the first letter of a pandas frequency alias
+_PERIODS_PER_YEAR = {'B': 252.0, 'D': 252.0, 'W': 52.0, 'M': 12.0}
+
+# infer_periods_per_year results keyed on (length, first, last) timestamps
+_PERIODS_CACHE: Dict[Tuple[int, int, int], float] = {}
+_PERIODS_CACHE_SIZE = 32
 
 
 def infer_periods_per_year(index: pd.DatetimeIndex) -> float:
@@ -44,6 +65,8 @@ def infer_periods_per_year(index: pd.DatetimeIndex) -> float:
     Uses `pandas.infer_freq` to guess the frequency.  If the frequency is
     daily or business daily, returns 252; weekly returns 52; monthly
     returns 12.  Defaults to 252 if the frequency cannot be inferred.
+    Results are memoised on the length and end points of the index, so
+    repeated calls for the same return series skip the index scan.
 
     Parameters
     ----------
@@ -55,29 +78,100 @@ def infer_periods_per_year(index: pd.DatetimeIndex) -> float:
     float
         Number of periods per year.
     """
+    try:
+        key = (len(index), index[0].value, index[-1].value)
+    except (IndexError, AttributeError):
+        key = None
+    if key is not None and key in _PERIODS_CACHE:
+        return _PERIODS_CACHE[key]
+
     try:
         freq = pd.infer_freq(index)
     except Exception:
         freq = None
-    if not freq:
-        return 252.0
-    freq = freq.upper()
-    if freq.startswith(('B', 'D')):
-        return 252.0
-    if freq.startswith('W'):
-        return 52.0
-    if freq.startswith('M'):
-        return 12.0
-    # Fallback
-    return 252.0
+    periods = _PERIODS_PER_YEAR.get(freq[:1].upper(), 252.0) if freq else 252.0
+
+    if key is not None:
+        if len(_PERIODS_CACHE) >= _PERIODS_CACHE_SIZE:
+            _PERIODS_CACHE.clear()
+        _PERIODS_CACHE[key] = periods
+    return periods
+
+
+def ledoit_wolf_cov(values: np.ndarray) -> np.ndarray:
+    """
+    Ledoit‑Wolf shrinkage estimate of the covariance of a T×K matrix.
+
+    Shrinks the (1/T normalised) sample covariance towards a scaled
+    identity with the analytically optimal intensity, giving a better
+    conditioned matrix when there are few observations per asset.  Matches
+    ``sklearn.covariance.LedoitWolf`` without requiring scikit‑learn.
+
+    Parameters
+    ----------
+    values : ndarray, shape (T, K)
+        Observations in rows, assets in columns.
+
+    Returns
+    -------
+    ndarray
+        Shrunk covariance matrix of shape (K, K).
+    """
+    x = values - values.mean(axis=0)
+    n_obs, n_assets = x.shape
+    emp_cov = x.T @ x / n_obs
+    target = np.trace(emp_cov) / n_assets
+    x2 = x ** 2
+    beta = (np.sum(x2.T @ x2) / n_obs - np.sum(emp_cov ** 2)) / (n_assets * n_obs)
+    delta = np.sum((emp_cov - target * np.eye(n_assets)) ** 2) / n_assets
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta / delta
+    shrunk = (1.0 - shrinkage) * emp_cov
+    shrunk.flat[::n_assets + 1] += shrinkage * target
+    return shrunk
+
+
+def annualised_moments(
+    returns: pd.DataFrame,
+    shrink: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Annualise the mean vector and covariance matrix of a return matrix.
+
+    Parameters
+    ----------
+    returns : DataFrame
+        DataFrame of percentage returns for each asset.
+    shrink : bool, optional
+        Use the Ledoit‑Wolf shrinkage estimator (:func:`ledoit_wolf_cov`)
+        instead of the sample covariance, by default False.
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        Annualised mean returns, shape (K,), and covariance matrix,
+        shape (K, K), scaled by :func:`infer_periods_per_year`.
+    """
+    periods = infer_periods_per_year(returns.index)
+    values = returns.to_numpy(dtype=float)
+    mu = values.mean(axis=0) * periods
+    if shrink:
+        cov = ledoit_wolf_cov(values)
+    else:
+        cov = np.cov(values, rowvar=False).reshape(values.shape[1], values.shape[1])
+    return mu, cov * periods
 
 
 def simulate_portfolios(
     returns: pd.DataFrame,
     rf_rate: float,
     n_portfolios: int = 500,
-    random_state: int | None = None,
-) -> Tuple[pd.DataFrame, Dict[str, Dict[str, float]]]:
+    random_state: int | np.random.Generator | None = None,
+    moments: Tuple[np.ndarray, np.ndarray] | None = None,
+    backend: str = 'numpy',
+    include_frame: bool = True,
+    dtype: np.dtype | type = np.float64,
+) -> Tuple[pd.DataFrame | None, Dict[str, Dict[str, float]]]:
     """
     Generate random portfolios and compute their statistics.
 
@@ -88,13 +182,31 @@ def simulate_portfolios(
     rf_rate : float
         Risk‑free rate expressed as a decimal (e.g., 0.0421 for 4.21 %).
     n_portfolios : int, optional
-        Number of random portfolios to simulate, by default 500.
-    random_state : int or None, optional
-        Seed for the random number generator.
+        Number of random portfolios to simulate, by default 500.  With a
+        single asset only the one fully invested portfolio is returned.
+    random_state : int, Generator or None, optional
+        Seed for, or an existing instance of, the random number generator.
+    moments : (ndarray, ndarray), optional
+        Precomputed output of :func:`annualised_moments` for ``returns``.
+        Computed here when omitted.
+    backend : {'numpy', 'numba'}, optional
+        Evaluate the portfolios with vectorised NumPy (default) or with the
+        compiled kernel in :mod:`monte_carlo_nb`, which avoids the (N, K)
+        temporaries and pays off for large ``n_portfolios``.  'numba' falls
+        back to NumPy when numba is not installed.
+    include_frame : bool, optional
+        Build the DataFrame of all simulated portfolios, by default True.
+        Callers that only need the optimal portfolios can pass False to
+        skip it, in which case ``None`` is returned in its place.
+    dtype : dtype, optional
+        Precision of the portfolio arithmetic, by default float64.
+        ``np.float32`` halves the memory traffic of the (N, K) products
+        and is ample for reporting.  Weights are drawn, and all results
+        returned, as float64 either way.
 
     Returns
     -------
-    (DataFrame, Dict[str, Dict[str, float]])
+    (DataFrame or None, Dict[str, Dict[str, float]])
         A tuple containing the simulated portfolios (with columns
         'Return', 'Volatility', 'Sharpe' and one column per ticker for
         weights) and a dictionary with details of the maximum Sharpe and
@@ -105,49 +217,180 @@ def simulate_portfolios(
     rng = np.random.default_rng(random_state)
     tickers = returns.columns.tolist()
     n_assets = len(tickers)
-    periods = infer_periods_per_year(returns.index)
-    mean_returns = returns.mean() * periods
-    cov_matrix = returns.cov() * periods
-
-    results = np.zeros((n_portfolios, 3 + n_assets))
-    for i in range(n_portfolios):
-        # Random weights sum to 1 using Dirichlet distribution
-        weights = rng.dirichlet(np.ones(n_assets))
-        # Expected return and volatility
-        port_return = float(np.dot(weights, mean_returns))
-        port_variance = float(np.dot(weights.T, np.dot(cov_matrix, weights)))
-        port_vol = np.sqrt(port_variance)
-        # Sharpe ratio
-        sharpe = (port_return - rf_rate) / port_vol if port_vol > 0 else 0.0
-        # Store results: Return, Volatility, Sharpe, weights...
-        results[i, 0] = port_return
-        results[i, 1] = port_vol
-        results[i, 2] = sharpe
-        results[i, 3:] = weights
-
-    # Build DataFrame
-    columns = ['Return', 'Volatility', 'Sharpe'] + tickers
-    df = pd.DataFrame(results, columns=columns)
+    mean_returns, cov_matrix = moments if moments is not None else annualised_moments(returns)
 
-    # Identify optimal portfolios
-    max_sharpe_idx = df['Sharpe'].idxmax()
-    min_vol_idx = df['Volatility'].idxmin()
+    mean_returns = np.ascontiguousarray(mean_returns, dtype=dtype)
+    cov_matrix = np.ascontiguousarray(cov_matrix, dtype=dtype)
 
-    def extract_portfolio(row: pd.Series) -> Dict[str, float]:
-        return {ticker: row[ticker] for ticker in tickers}
+    if backend not in ('numpy', 'numba'):
+        raise ValueError(f"backend must be 'numpy' or 'numba', got {backend!r}")
+
+    if n_assets == 1:
+        # A single asset admits only the fully invested portfolio
+        n_portfolios = 1
+        weights = np.ones((1, 1))
+    else:
+        # Random weights sum to 1 using Dirichlet distribution, drawn in one call
+        weights = rng.dirichlet(np.ones(n_assets), size=n_portfolios)
+    # The reported weights stay in float64; only the arithmetic is downcast
+    w = weights.astype(dtype, copy=False)
+    if backend == 'numba' and NUMBA_AVAILABLE:
+        # Fused per-portfolio loop in the compiled kernel
+        port_returns, port_vols, sharpes = portfolio_stats(
+            w, mean_returns, cov_matrix, rf_rate
+        )
+    else:
+        port_returns = w @ mean_returns
+        variances = np.diag(cov_matrix)
+        if np.array_equal(cov_matrix, np.diag(variances)):
+            # Uncorrelated assets: w' S w is a weighted sum of squares
+            port_vols = np.sqrt((w * w) @ variances)
+        else:
+            # Row-wise quadratic form w' S w without an (N, N) intermediate,
+            # in blocks so each W @ S product stays cache resident
+            port_vols = np.empty(n_portfolios, dtype=w.dtype)
+            for start in range(0, n_portfolios, SIM_BLOCK_SIZE):
+                block = w[start:start + SIM_BLOCK_SIZE]
+                port_vols[start:start + SIM_BLOCK_SIZE] = np.einsum(
+                    'ij,ij->i', block @ cov_matrix, block
+                )
+            np.sqrt(port_vols, out=port_vols)
+        safe_vols = np.where(port_vols > 0, port_vols, 1.0)
+        sharpes = np.where(port_vols > 0, (port_returns - rf_rate) / safe_vols, 0.0)
+
+    port_returns = port_returns.astype(np.float64, copy=False)
+    port_vols = port_vols.astype(np.float64, copy=False)
+    sharpes = sharpes.astype(np.float64, copy=False)
+
+    # Identify optimal portfolios directly on the arrays
+    def extract_portfolio(i: int) -> Dict[str, float]:
+        return {
+            'return': float(port_returns[i]),
+            'volatility': float(port_vols[i]),
+            'sharpe': float(sharpes[i]),
+            'weights': dict(zip(tickers, weights[i].tolist())),
+        }
 
     optimal = {
-        'max_sharpe': {
-            'return': df.loc[max_sharpe_idx, 'Return'],
-            'volatility': df.loc[max_sharpe_idx, 'Volatility'],
-            'sharpe': df.loc[max_sharpe_idx, 'Sharpe'],
-            'weights': extract_portfolio(df.loc[max_sharpe_idx])
-        },
-        'min_vol': {
-            'return': df.loc[min_vol_idx, 'Return'],
-            'volatility': df.loc[min_vol_idx, 'Volatility'],
-            'sharpe': df.loc[min_vol_idx, 'Sharpe'],
-            'weights': extract_portfolio(df.loc[min_vol_idx])
+        'max_sharpe': extract_portfolio(int(np.argmax(sharpes))),
+        'min_vol': extract_portfolio(int(np.argmin(port_vols))),
+    }
+    if not include_frame:
+        return None, optimal
+
+    # Build DataFrame, adopting the freshly stacked array rather than copying it
+    columns = ['Return', 'Volatility', 'Sharpe'] + tickers
+    df = pd.DataFrame(
+        np.column_stack([port_returns, port_vols, sharpes, weights]),
+        columns=columns,
+        copy=False,
+    )
+    return df, optimal
+
+
+def efficient_frontier(
+    returns: pd.DataFrame,
+    rf_rate: float,
+    n_points: int = 500,
+    moments: Tuple[np.ndarray, np.ndarray] | None = None,
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, float]]]:
+    """
+    Compute the mean-variance efficient frontier in closed form.
+
+    Uses the two-fund theorem: every frontier portfolio is ``f + rho * g``
+    for a target return ``rho``, where ``f`` and ``g`` are derived from the
+    inverse covariance matrix.  The frontier is sampled at ``n_points``
+    target returns from the minimum variance portfolio up to the best
+    single-asset return or the tangency portfolio's return, whichever is
+    higher; the tangency portfolio itself is one of the samples.  Weights are unconstrained, so short positions
+    are possible.
+
+    Parameters
+    ----------
+    returns : DataFrame
+        DataFrame of percentage returns for each asset.
+    rf_rate : float
+        Risk‑free rate expressed as a decimal (e.g., 0.0421 for 4.21 %).
+    n_points : int, optional
+        Number of frontier portfolios to sample, by default 500.
+    moments : (ndarray, ndarray), optional
+        Precomputed output of :func:`annualised_moments` for ``returns``.
+
+    Returns
+    -------
+    (DataFrame, Dict[str, Dict[str, float]])
+        Same layout as :func:`simulate_portfolios`: the frontier portfolios
+        (columns 'Return', 'Volatility', 'Sharpe' and one weight column per
+        ticker) and the 'max_sharpe' (tangency) and 'min_vol' portfolios.
+        When the risk-free rate is not below the minimum-variance return
+        there is no tangency portfolio, and 'max_sharpe' is the sampled
+        frontier portfolio with the highest Sharpe ratio.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the covariance matrix is singular.
+    """
+    tickers = returns.columns.tolist()
+    mu, cov = moments if moments is not None else annualised_moments(returns)
+    inv_cov = np.linalg.inv(cov)
+    ones = np.ones(len(tickers))
+
+    a11 = ones @ inv_cov @ ones
+    a12 = mu @ inv_cov @ ones
+    a22 = mu @ inv_cov @ mu
+    d = a11 * a22 - a12 ** 2
+    f = inv_cov @ (a22 * ones - a12 * mu) / d
+    g = inv_cov @ (a11 * mu - a12 * ones) / d
+
+    # Tangency portfolio: weights proportional to inv(S) @ (mu - rf).  It only
+    # exists while rf is below the minimum-variance return a12/a11
+    tangency = None
+    if a12 / a11 > rf_rate:
+        excess = inv_cov @ (mu - rf_rate * ones)
+        tangency = excess / excess.sum()
+
+    # Frontier weights for each target return, one column per portfolio.  With
+    # short sales the tangency return can exceed every single-asset return,
+    # so the range is widened to reach it and the nearest sample is replaced
+    # by the exact tangency return, making it selectable from the frame
+    upper = max(mu.max(), a12 / a11)
+    if tangency is not None:
+        upper = max(upper, float(mu @ tangency))
+    rho = np.linspace(a12 / a11, upper, n_points)
+    if tangency is not None and n_points > 1:
+        rho[max(1, int(np.argmin(np.abs(rho - mu @ tangency))))] = mu @ tangency
+    weights = f[:, None] + rho[None, :] * g[:, None]
+    port_returns = mu @ weights
+    port_vols = np.sqrt(np.einsum('ij,ik,kj->j', weights, cov, weights))
+    sharpes = np.where(port_vols > 0, (port_returns - rf_rate) / port_vols, 0.0)
+
+    columns = ['Return', 'Volatility', 'Sharpe'] + tickers
+    df = pd.DataFrame(
+        np.column_stack([port_returns, port_vols, sharpes, weights.T]),
+        columns=columns,
+        copy=False,
+    )
+
+    def describe(w: np.ndarray) -> Dict[str, float]:
+        ret = float(mu @ w)
+        vol = float(np.sqrt(w @ cov @ w))
+        return {
+            'return': ret,
+            'volatility': vol,
+            'sharpe': (ret - rf_rate) / vol if vol > 0 else 0.0,
+            'weights': dict(zip(tickers, w.tolist())),
         }
+
+    if tangency is not None:
+        max_sharpe = tangency
+    else:
+        # With rf at or above the minimum-variance return no tangency
+        # portfolio exists; the normalised formula would land on the lower
+        # branch, so take the best sampled frontier point instead
+        max_sharpe = weights[:, int(np.argmax(sharpes))]
+    optimal = {
+        'max_sharpe': describe(max_sharpe),
+        'min_vol': describe(inv_cov @ ones / a11),
     }
     return df, optimal
@@ -0,0 +1,127 @@
+"""
+Optional Numba kernel for the Monte Carlo portfolio statistics.
+
+When `numba` is installed, ``_mc_kernel`` is compiled on first use to
+a parallel native loop that evaluates the expected return, volatility
+and Sharpe ratio of every simulated portfolio in one fused pass,
+without the (N, K) temporaries of the NumPy expression.  ``portfolio_stats`` is the
+plain Python entry point that calls it.  Random weights are still drawn
+by NumPy in :mod:`monte_carlo` so seeded runs remain reproducible, and
+the covariance matrix is computed outside the kernel and passed in.
+
+If `numba` is not available, ``NUMBA_AVAILABLE`` is ``False`` and
+:func:`monte_carlo.simulate_portfolios` uses its NumPy implementation;
+``portfolio_stats`` still works but runs at interpreter speed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+from typing import Callable, Tuple
+
+import numpy as np
+
+# numba is only imported (and the kernel compiled) on first use, so
+# importing this module stays cheap for callers that never opt in
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Loop construct used by ``_mc_kernel``; swapped for ``numba.prange``
+# just before compilation so the outer loop runs in parallel
+_prange = range
+
+# Streamlit serves each session on its own thread, and not every Numba
+# threading layer (TBB, OpenMP or workqueue, whichever is installed) can
+# run parallel kernels launched from several threads at once.
+_KERNEL_LOCK = threading.Lock()
+
+_compiled_kernel: Callable | None = None
+
+
+def _kernel() -> Callable:
+    """Return ``_mc_kernel``, compiled on the first call when numba is installed."""
+    global _compiled_kernel, _prange
+    if _compiled_kernel is None:
+        if not NUMBA_AVAILABLE:
+            _compiled_kernel = _mc_kernel
+        else:
+            import numba
+            # A process that has run a TBB-backed parallel kernel from a
+            # non-main thread (as Streamlit does) hangs at exit, so default
+            # to the portable workqueue layer unless one was chosen explicitly
+            if 'NUMBA_THREADING_LAYER' not in os.environ:
+                numba.config.THREADING_LAYER = 'workqueue'
+            _prange = numba.prange
+            _compiled_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_mc_kernel)
+    return _compiled_kernel
+
+
+def _mc_kernel(
+    weights: np.ndarray,
+    mu: np.ndarray,
+    cov: np.ndarray,
+    rf_rate: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n, k = weights.shape
+    # Outputs and accumulators follow the input precision
+    rets = np.empty(n, dtype=weights.dtype)
+    vols = np.empty(n, dtype=weights.dtype)
+    sharpes = np.empty(n, dtype=weights.dtype)
+    zero = np.zeros(1, dtype=weights.dtype)[0]
+    for i in _prange(n):
+        r = zero
+        v = zero
+        for a in range(k):
+            r += weights[i, a] * mu[a]
+            tmp = zero
+            for b in range(k):
+                tmp += cov[a, b] * weights[i, b]
+            v += weights[i, a] * tmp
+        vol = np.sqrt(v)
+        rets[i] = r
+        vols[i] = vol
+        sharpes[i] = (r - rf_rate) / vol if vol > 0 else 0.0
+    return rets, vols, sharpes
+
+
+def portfolio_stats(
+    weights: np.ndarray,
+    mu: np.ndarray,
+    cov: np.ndarray,
+    rf_rate: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the return, volatility and Sharpe ratio of each row of ``weights``.
+
+    Parameters
+    ----------
+    weights : ndarray, shape (N, K)
+        Portfolio weights, one portfolio per row, as a C‑contiguous float32
+        or float64 array matching ``mu`` and ``cov``.
+    mu : ndarray, shape (K,)
+        Annualised mean returns.
+    cov : ndarray, shape (K, K)
+        Annualised covariance matrix.
+    rf_rate : float
+        Risk‑free rate expressed as a decimal.
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        Expected returns, volatilities and Sharpe ratios (0 where the
+        volatility is zero), each of shape (N,) and computed in the
+        precision of ``weights``.
+    """
+    with _KERNEL_LOCK:
+        return _kernel()(weights, mu, cov, mu.dtype.type(rf_rate))
+
+
+def warm_up() -> None:
+    """Trigger compilation of the kernel for both supported precisions."""
+    if NUMBA_AVAILABLE:
+        for dtype in (np.float32, np.float64):
+            portfolio_stats(
+                np.full((4, 2), 0.5, dtype=dtype), np.zeros(2, dtype=dtype),
+                np.eye(2, dtype=dtype), 0.0,
+            )
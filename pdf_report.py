@@ -2,9 +2,9 @@
 PDF report generation using matplotlib.
 
 The report is assembled into a multi-page PDF using
-``matplotlib.backends.backend_pdf.PdfPages``.  Each page is created
-explicitly and contains text, tables or charts relevant to the
-portfolio analysis.  This module is designed to operate without
+``matplotlib.backends.backend_pdf.PdfPages``.  A single A4 figure is
+cleared and redrawn for each page, which contains text, tables or
+charts relevant to the portfolio analysis.  This module is designed to operate without
 external PDF libraries, making it suitable for restricted
 environments.
 """
@@ -12,18 +12,37 @@ environments.
 from __future__ import annotations
 
 import io
+import threading
 from datetime import datetime
 from typing import Dict, List
 
-import matplotlib.pyplot as plt
+import matplotlib.style
+import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
 
+# Settings pinned on top of the 'fast' style (which already simplifies
+# paths) so a user matplotlibrc cannot make every text call shell out to
+# LaTeX or turn off stream compression.  They are installed in the global
+# rcParams for the duration of a report (see _REPORT_LOCK), not per figure
+REPORT_RC = {'text.usetex': False, 'pdf.compression': 6}
 
-def _create_cover_page(pdf: PdfPages, user_name: str | None, country: str) -> None:
+# matplotlib.style.context swaps the process-wide rcParams, so reports built
+# concurrently (Streamlit runs each session on its own thread) must not
+# interleave their enter/exit, or the report style would stay in place
+_REPORT_LOCK = threading.Lock()
+
+# Above this many portfolios the frontier page bins points into hexagons
+# instead of drawing one vector marker each
+HEXBIN_THRESHOLD = 5000
+
+
+def _create_cover_page(
+    pdf: PdfPages, fig: Figure, user_name: str | None, country: str
+) -> None:
     """Generate the cover page of the report."""
-    fig = plt.figure(figsize=(8.27, 11.69))  # A4 portrait
-    fig.patch.set_facecolor('white')
+    fig.clf()
     title = 'Portfolio Optimisation Report'
     subtitle = f'Country: {country}'
     date_str = datetime.now().strftime('%B %d, %Y')
@@ -43,11 +62,11 @@ def _create_cover_page(pdf: PdfPages, user_name: str | None, country: str) -> No
     ax.set_yticks([])
     ax.plot([0.2, 0.8], [y_pos - 0.05, y_pos - 0.05], color='gray')
     pdf.savefig(fig)
-    plt.close(fig)
 
 
 def _create_summary_page(
     pdf: PdfPages,
+    fig: Figure,
     country: str,
     rf: float,
     erp: float,
@@ -56,8 +75,7 @@ def _create_summary_page(
     tickers: List[str]
 ) -> None:
     """Generate the executive summary page."""
-    fig = plt.figure(figsize=(8.27, 11.69))
-    fig.patch.set_facecolor('white')
+    fig.clf()
     y = 0.9
     fig.text(0.5, y, 'Executive Summary', fontsize=20, ha='center', weight='bold')
     y -= 0.06
@@ -69,11 +87,11 @@ def _create_summary_page(
     )
     fig.text(0.1, y, summary, fontsize=12, va='top', wrap=True)
     pdf.savefig(fig)
-    plt.close(fig)
 
 
 def _create_personalized_notes_page(
     pdf: PdfPages,
+    fig: Figure,
     user_profile: Dict[str, str]
 ) -> None:
     """
@@ -81,8 +99,7 @@ def _create_personalized_notes_page(
     investment goal, and investment horizon. Each combination
     yields a unique narrative.
     """
-    fig = plt.figure(figsize=(8.27, 11.69))
-    fig.patch.set_facecolor('white')
+    fig.clf()
     y = 0.9
     fig.text(0.5, y, 'Personalized Notes', fontsize=20, ha='center', weight='bold')
     y -= 0.06
@@ -122,17 +139,17 @@ def _create_personalized_notes_page(
     # Write the narrative on the figure
     fig.text(0.1, y, line, fontsize=12, va='top', wrap=True)
     pdf.savefig(fig)
-    plt.close(fig)
 
 
 def _create_recommendation_page(
     pdf: PdfPages,
+    fig: Figure,
     optimal: Dict[str, float],
     market_data: Dict[str, float]
 ) -> None:
     """Generate the portfolio recommendation page with a table and pie chart."""
-    fig, ax = plt.subplots(2, 1, figsize=(8.27, 11.69), gridspec_kw={'height_ratios': [1, 2]})
-    fig.patch.set_facecolor('white')
+    fig.clf()
+    ax = fig.subplots(2, 1, gridspec_kw={'height_ratios': [1, 2]})
     fig.suptitle('Portfolio Recommendation', fontsize=20, weight='bold')
 
     # Top: summary table
@@ -159,22 +176,38 @@ def _create_recommendation_page(
     weights = optimal['weights']
     labels = list(weights.keys())
     values = list(weights.values())
-    ax[1].pie(values, labels=labels, autopct=lambda p: f'{p:.1f}%')
+    if min(values) < 0:
+        # Short positions (closed-form frontier) cannot be drawn as pie wedges
+        ax[1].barh(labels, values)
+        ax[1].axvline(0, color='gray', linewidth=0.8)
+        ax[1].xaxis.set_major_formatter(lambda x, _: f'{x:.0%}')
+    else:
+        ax[1].pie(values, labels=labels, autopct=lambda p: f'{p:.1f}%')
     ax[1].set_title('Asset Allocation', fontsize=14)
     pdf.savefig(fig)
-    plt.close(fig)
 
 
 def _create_chart_page(
     pdf: PdfPages,
+    fig: Figure,
     sim_df: pd.DataFrame,
     optimal: Dict[str, float]
 ) -> None:
     """Generate a page with the efficient frontier chart."""
-    fig, ax = plt.subplots(figsize=(8.27, 11.69))
-    fig.patch.set_facecolor('white')
+    fig.clf()
+    ax = fig.subplots()
     ax.set_title('Efficient Frontier (colour = Sharpe ratio)', fontsize=16)
-    scatter = ax.scatter(sim_df['Volatility'], sim_df['Return'], c=sim_df['Sharpe'], cmap='viridis', s=10)
+    vol = sim_df['Volatility'].to_numpy()
+    ret = sim_df['Return'].to_numpy()
+    sharpe = sim_df['Sharpe'].to_numpy()
+    # Large clouds are binned (colour = best Sharpe ratio per cell) so the
+    # page size stops growing with the number of portfolios
+    if vol.size > HEXBIN_THRESHOLD:
+        scatter = ax.hexbin(
+            vol, ret, C=sharpe, reduce_C_function=np.max, gridsize=80, cmap='viridis'
+        )
+    else:
+        scatter = ax.scatter(vol, ret, c=sharpe, cmap='viridis', s=10)
     # Mark the optimal point
     ax.scatter(optimal['volatility'], optimal['return'], marker='*', color='red', s=150, label='Chosen Portfolio')
     ax.set_xlabel('Volatility')
@@ -182,7 +215,6 @@ def _create_chart_page(
     fig.colorbar(scatter, ax=ax, label='Sharpe Ratio')
     ax.legend()
     pdf.savefig(fig)
-    plt.close(fig)
 
 
 def generate_pdf_report(
@@ -199,7 +231,9 @@ def generate_pdf_report(
     Parameters
     ----------
     buffer : BytesIO
-        The buffer to which the PDF will be written.
+        The buffer to which the PDF will be written, starting at its current
+        position.  It may be pre-sized; anything past the end of the report
+        is truncated.
     user_profile : dict
         Contains 'name', 'country', 'risk_tolerance', 'goal', 'horizon'.
     market_data : dict
@@ -214,17 +248,24 @@ def generate_pdf_report(
     user_name = user_profile.get('name') or None
     country = user_profile.get('country', '')
 
-    pdf = PdfPages(buffer)
-    try:
-        _create_cover_page(pdf, user_name, country)
-        _create_summary_page(
-            pdf, country,
-            market_data['rf'], market_data['erp'], market_data['crp'],
-            n_portfolios, list(sim_df.columns[3:])
-        )
-        _create_personalized_notes_page(pdf, user_profile)
-        _create_recommendation_page(pdf, optimal, market_data)
-        _create_chart_page(pdf, sim_df, optimal)
-    finally:
-        pdf.close()
+    # One A4 portrait figure is cleared and redrawn for every page.  It is
+    # created without pyplot, so no global figure registry or backend is
+    # used.  The report style does change the global rcParams while it is
+    # drawn: charts another session creates meanwhile may pick it up.
+    with _REPORT_LOCK, matplotlib.style.context(['fast', REPORT_RC]):
+        fig = Figure(figsize=(8.27, 11.69), facecolor='white')
+        pdf = PdfPages(buffer)
+        try:
+            _create_cover_page(pdf, fig, user_name, country)
+            _create_summary_page(
+                pdf, fig, country,
+                market_data['rf'], market_data['erp'], market_data['crp'],
+                n_portfolios, list(sim_df.columns[3:])
+            )
+            _create_personalized_notes_page(pdf, fig, user_profile)
+            _create_recommendation_page(pdf, fig, optimal, market_data)
+            _create_chart_page(pdf, fig, sim_df, optimal)
+        finally:
+            pdf.close()
+    buffer.truncate()
     buffer.seek(0)
@@ -0,0 +1,168 @@
+"""
+Portfolio selection based on the investor profile.
+
+This module turns the simulated (or closed‑form) portfolios into a single
+recommendation.  Annual statistics are first scaled to the investment
+horizon, the risk tolerance then narrows the candidate set and the
+investment goal picks one portfolio from it.  The functions are pure
+pandas/NumPy so they can be used without Streamlit.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+RISK_LABELS = {'Low': 'Low Risk', 'Moderate': 'Moderate Risk', 'High': 'High Risk'}
+GOAL_LABELS = {
+    'Capital Preservation': 'Min Volatility',
+    'High Risk-High Return': 'High Return',
+    'Long-Term Growth': 'Max Sharpe',
+    'Balanced': 'Balanced',
+}
+
+# Column and arg-reduction that pick the portfolio for each goal; goals not
+# listed here (Balanced) are handled in ``select_portfolio``.
+GOAL_SELECTORS = {
+    'Capital Preservation': ('Volatility_h', np.nanargmin),
+    'High Risk-High Return': ('Return_h', np.nanargmax),
+    'Long-Term Growth': ('Sharpe_h', np.nanargmax),
+}
+
+
+def horizon_years(horizon: str) -> int:
+    """
+    Convert a horizon label such as ``'5Y'`` or ``'10+Y'`` to whole years.
+
+    Unrecognised labels default to one year.
+    """
+    try:
+        return int(horizon.rstrip('Y').rstrip('+'))
+    except ValueError:
+        return 1
+
+
+def scale_to_horizon(sim_df: pd.DataFrame, h: int, rf_rate: float) -> pd.DataFrame:
+    """
+    Add horizon‑scaled statistics to a frame of simulated portfolios.
+
+    Parameters
+    ----------
+    sim_df : DataFrame
+        Portfolios with annual 'Return' and 'Volatility' columns.
+    h : int
+        Investment horizon in years.
+    rf_rate : float
+        Annual risk‑free rate expressed as a decimal.
+
+    Returns
+    -------
+    DataFrame
+        A copy of ``sim_df`` with 'Return_h' (compounded), 'Volatility_h'
+        (square‑root‑of‑time scaled) and 'Sharpe_h' columns appended.
+    """
+    ret = sim_df['Return'].to_numpy()
+    vol = sim_df['Volatility'].to_numpy()
+    ret_h = np.power(1.0 + ret, h) - 1.0
+    vol_h = vol * h ** 0.5
+    sharpe_h = (ret_h - rf_rate * h) / vol_h
+    scaled = sim_df.copy()
+    scaled[['Return_h', 'Volatility_h', 'Sharpe_h']] = np.column_stack(
+        [ret_h, vol_h, sharpe_h]
+    )
+    return scaled
+
+
+def _lower_quartile(values: np.ndarray) -> float:
+    """
+    25th percentile with linear interpolation (as ``Series.quantile``),
+    found by partial partitioning in O(N) rather than a full sort.
+    """
+    pos = 0.25 * (values.size - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, values.size - 1)
+    part = np.partition(values, [lo, hi])
+    return float(part[lo] + (part[hi] - part[lo]) * (pos - lo))
+
+
+def select_portfolio(
+    sim_df: pd.DataFrame,
+    tickers: List[str],
+    risk_tolerance: str,
+    investment_goal: str,
+) -> Dict[str, object]:
+    """
+    Choose the recommended portfolio for an investor profile.
+
+    Low risk tolerance restricts the candidates to the least volatile
+    quarter of portfolios; Moderate and High consider all of them.  Within
+    the candidates, Capital Preservation takes the minimum volatility,
+    High Risk-High Return the maximum return, Long-Term Growth the maximum
+    Sharpe ratio and Balanced the portfolio closest to the median
+    volatility.
+
+    Parameters
+    ----------
+    sim_df : DataFrame
+        Portfolios with horizon‑scaled columns from :func:`scale_to_horizon`
+        and one weight column per ticker.
+    tickers : list of str
+        Weight columns to report.
+    risk_tolerance : str
+        One of 'Low', 'Moderate' or 'High'.
+    investment_goal : str
+        One of the keys of ``GOAL_LABELS``.
+
+    Returns
+    -------
+    dict
+        Keys 'weights' (ticker to weight), 'return', 'volatility' and
+        'sharpe' (horizon scaled), plus 'risk_label' and 'goal_label'
+        describing the selection.
+
+    Raises
+    ------
+    KeyError
+        If ``sim_df`` has no weight column for one of ``tickers``.
+    """
+    vol_h = sim_df['Volatility_h'].to_numpy()
+    # The minimum-volatility portfolio always lies in the lowest-volatility
+    # quartile, so the Low filter only matters for the other goals
+    if risk_tolerance == 'Low' and investment_goal != 'Capital Preservation':
+        candidates = np.flatnonzero(vol_h <= _lower_quartile(vol_h))
+    else:
+        candidates = None
+
+    selector = GOAL_SELECTORS.get(investment_goal)
+    if selector is not None:
+        column, pick = selector
+        values = sim_df[column].to_numpy()
+    else:  # Balanced: closest to the median candidate volatility
+        median = np.median(vol_h if candidates is None else vol_h[candidates])
+        values = np.abs(vol_h - median)
+        pick = np.argmin
+    if candidates is None:
+        pos = int(pick(values))
+    else:
+        pos = int(candidates[pick(values[candidates])])
+
+    columns = sim_df.columns
+    ticker_pos = columns.get_indexer(tickers)
+    if (ticker_pos < 0).any():
+        missing = [t for t, i in zip(tickers, ticker_pos) if i < 0]
+        raise KeyError(f"No weight column for tickers: {', '.join(missing)}")
+    weights = sim_df.iloc[pos, ticker_pos].to_numpy()
+    stats = sim_df.iloc[
+        pos, columns.get_indexer(['Return_h', 'Volatility_h', 'Sharpe_h'])
+    ].to_numpy()
+    return {
+        'weights': dict(zip(tickers, weights.tolist())),
+        'return': float(stats[0]),
+        'volatility': float(stats[1]),
+        'sharpe': float(stats[2]),
+        'risk_label': RISK_LABELS.get(risk_tolerance, 'Moderate Risk'),
+        'goal_label': GOAL_LABELS.get(investment_goal, 'Balanced'),
+    }
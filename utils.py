@@ -7,11 +7,37 @@ price series, aligning returns, and other small conveniences.
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from typing import Dict, Tuple, List, IO
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the environment
+    pyarrow = None
+
+# Parse CSVs with the multithreaded Arrow reader when it is installed
+CSV_ENGINE = 'pyarrow' if pyarrow is not None else 'c'
+
+# Date layouts recognised from a sample value, with their strptime formats
+# (strptime's %m and %d also accept a single digit)
+_DATE_FORMATS = (
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4}'), '%d-%m-%Y'),
+)
+
+# Values starting with a four-digit year are never read day first
+_YEAR_FIRST = re.compile(r'\d{4}\D')
+
+# Accepted price column names, in order of preference
+PRICE_CANDIDATES = (
+    'Price', 'Adj Close', 'Adj close', 'AdjClose', 'Close', 'close', 'Adj Close*', 'Adj_Close',
+)
+
 
 def parse_ticker_from_filename(filename: str) -> str:
     """
@@ -39,6 +65,26 @@ def parse_ticker_from_filename(filename: str) -> str:
     return name
 
 
+def _parse_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings with a single ``to_datetime`` call.
+
+    The format is sniffed from the first non-null value: YYYY-MM-DD and
+    DD-MM-YYYY (with or without zero padding) use the exact-format parser,
+    other year-first layouts are parsed month before day and anything else
+    day first.  Unparseable values become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates  # already converted by the CSV reader
+    first = dates.first_valid_index()
+    sample = str(dates[first]).strip() if first is not None else ''
+    for pattern, fmt in _DATE_FORMATS:
+        if pattern.fullmatch(sample):
+            return pd.to_datetime(dates, format=fmt, errors='coerce')
+    dayfirst = _YEAR_FIRST.match(sample) is None
+    return pd.to_datetime(dates, dayfirst=dayfirst, errors='coerce')
+
+
 def load_price_file(file_obj: IO[bytes], filename: str) -> pd.Series:
     """
     Load a price CSV file into a pandas Series.
@@ -58,41 +104,47 @@ def load_price_file(file_obj: IO[bytes], filename: str) -> pd.Series:
     Raises
     ------
     ValueError
-        If the file does not contain a recognised price column or date format.
+        If the file has duplicate column names or does not contain a
+        recognised price column or date format.
     """
     ticker = parse_ticker_from_filename(filename)
-    df = pd.read_csv(file_obj)
+    try:
+        df = pd.read_csv(file_obj, engine=CSV_ENGINE)
+    except ValueError:
+        if CSV_ENGINE == 'c':
+            raise
+        df = None
+    if df is None or not df.columns.is_unique:
+        # The Arrow reader rejects ragged rows (which the C engine pads with
+        # NaN) and keeps repeated headers (which the C engine suffixes '.1')
+        file_obj.seek(0)
+        df = pd.read_csv(file_obj, engine='c')
 
     # Normalize column names
     df.columns = [c.strip() for c in df.columns]
+    if not df.columns.is_unique:
+        duplicated = sorted(set(df.columns[df.columns.duplicated()]))
+        raise ValueError(f"File {filename} has duplicate columns: {', '.join(duplicated)}.")
+    columns = set(df.columns)
 
     # Identify the price column (Close/Adj Close/Price)
-    price_col = None
-    for candidate in ['Price', 'Adj Close', 'Adj close', 'AdjClose', 'Close', 'close', 'Adj Close*', 'Adj_Close']:
-        if candidate in df.columns:
-            price_col = candidate
-            break
+    price_col = next((c for c in PRICE_CANDIDATES if c in columns), None)
     if price_col is None:
         raise ValueError(f"File {filename} does not contain a 'Close', 'Adj Close', or 'Price' column.")
 
-    # Parse dates using multiple formats
-    if 'Date' not in df.columns:
+    if 'Date' not in columns:
         raise ValueError(f"File {filename} does not contain a 'Date' column.")
-    try:
-        df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d')
-    except Exception:
-        try:
-            df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
-        except Exception:
-            df['Date'] = pd.to_datetime(df['Date'], dayfirst=True, errors='coerce')
+    df['Date'] = _parse_dates(df['Date'])
 
     # Drop rows with unrecognized dates
     df = df.dropna(subset=['Date'])
     if df.empty:
         raise ValueError(f"Could not parse dates in file {filename}. Please use YYYY-MM-DD or DD-MM-YYYY format.")
 
-    # Sort by date and extract the price series
-    df[price_col] = df[price_col].astype(str).str.replace(',', '', regex=False).astype(float)
+    # Only text columns (e.g. with thousands separators) need string cleaning
+    if not pd.api.types.is_numeric_dtype(df[price_col]):
+        df[price_col] = df[price_col].astype(str).str.replace(',', '', regex=False)
+    df[price_col] = df[price_col].astype(float)
     series = df.set_index('Date')[price_col]
 
     series.name = ticker
@@ -112,9 +164,17 @@ def align_price_series(series_list: List[pd.Series]) -> pd.DataFrame:
     Returns
     -------
     DataFrame
-        DataFrame of aligned prices (dates as index, tickers as columns).
+        DataFrame of aligned prices (dates ascending as index, tickers as
+        columns).
     """
     if not series_list:
         return pd.DataFrame()
-    df = pd.concat(series_list, axis=1, join='inner')
-    return df
+    # One sorted intersection of the raw datetime64 values, then a single
+    # reindex per series, instead of pandas' pairwise index alignment
+    common = functools.reduce(np.intersect1d, [s.index.to_numpy() for s in series_list])
+    data = np.column_stack([s.reindex(common).to_numpy() for s in series_list])
+    return pd.DataFrame(
+        data,
+        index=pd.DatetimeIndex(common, name=series_list[0].index.name),
+        columns=[s.name for s in series_list],
+    )